@@ -2,55 +2,79 @@
 
 from __future__ import annotations
 
-import argparse
-from pathlib import Path
-
-from . import __version__, db
+import sys
+
+# db (and with it sqlite3/csv/datetime) is imported inside each cmd_* so that
+# --help and --version don't pay for it; argparse likewise waits for
+# build_parser().
+from . import __version__
+
+# Table columns as (header, index into a row in Application field order).
+_TABLE_COLUMNS = [
+    ("id", 0),
+    ("company", 1),
+    ("role", 2),
+    ("status", 4),
+    ("applied_date", 5),
+    ("last_update", 6),
+    ("source", 3),
+    ("notes", 7),
+]
 
 
 def _print_table(rows):
+    """Print rows (sequences in Application field order) as a fixed-width table."""
     if not rows:
         print("No records found.")
         return
     # Simple fixed-width formatting
-    headers = ["id", "company", "role", "status", "applied_date", "last_update", "source", "notes"]
-    data = [
-        [
-            str(r.id),
-            r.company,
-            r.role,
-            r.status,
-            r.applied_date,
-            r.last_update,
-            str(r.source or ""),
-            str(r.notes or ""),
-        ]
-        for r in rows
+    headers = [h for h, _ in _TABLE_COLUMNS]
+    indexes = [i for _, i in _TABLE_COLUMNS]
+    to_str = str  # local alias: skips the builtins lookup for every cell
+    # Stringify cells and track column widths in the same pass over the rows.
+    widths = [len(h) for h in headers]
+    data = []
+    for r in rows:
+        cells = ["" if (v := r[i]) is None else to_str(v) for i in indexes]
+        for col, cell in enumerate(cells):
+            if len(cell) > widths[col]:
+                widths[col] = len(cell)
+        data.append(cells)
+    # Pad with ljust and emit the whole table in one write instead of running
+    # str.format (and print) per line.
+    sep = "  "
+    lines = [
+        sep.join(h.ljust(w) for h, w in zip(headers, widths)),
+        sep.join("-" * w for w in widths),
     ]
-    widths = [max(len(h), *(len(row[i]) for row in data)) for i, h in enumerate(headers)]
-    fmt = "  ".join("{:" + str(w) + "}" for w in widths)
-    print(fmt.format(*headers))
-    print(fmt.format(*["-" * w for w in widths]))
-    for row in data:
-        print(fmt.format(*row))
+    lines.extend(sep.join(c.ljust(w) for c, w in zip(row, widths)) for row in data)
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def cmd_init(args):
+    from . import db
+
     db.init_db()
     print("Database initialized.")
 
 
 def cmd_search(args):
-    rows = db.search_applications(query=args.q, limit=args.limit)
+    from . import db
+
+    rows = db.search_applications_raw(query=args.q, limit=args.limit)
     _print_table(rows)
 
 
 def cmd_delete(args):
+    from . import db
+
     ok = db.delete_application(args.id)
     print("Deleted." if ok else f"No application with id={args.id}.")
 
 
 def cmd_add(args):
+    from . import db
+
     app_id = db.add_application(
         company=args.company,
         role=args.role,
@@ -63,6 +87,8 @@ def cmd_add(args):
 
 
 def cmd_summary(args):
+    from . import db
+
     s = db.summary_last_n_days(days=args.days)
     print(f"Summary since {s['since']} ({s['days']} days)")
     print(f"Total: {s['total']}")
@@ -72,16 +98,22 @@ def cmd_summary(args):
 
 
 def cmd_list(args):
-    rows = db.list_applications(status=args.status, limit=args.limit, since=args.since)
+    from . import db
+
+    rows = db.list_applications_raw(status=args.status, limit=args.limit, since=args.since)
     _print_table(rows)
 
 
 def cmd_update(args):
+    from . import db
+
     db.update_status(app_id=args.id, status=args.status, notes=args.notes)
     print(f"Updated application id={args.id}.")
 
 
 def cmd_stats(args):
+    from . import db
+
     s = db.stats()
     print("Total:", s["total"])
     print("Applied last 7 days:", s["applied_last_7_days"])
@@ -91,25 +123,27 @@ def cmd_stats(args):
 
 
 def cmd_export(args):
+    from pathlib import Path
+
+    from . import db
+
     out = Path(args.out)
     n = db.export_csv(out)
     print(f"Wrote {n} rows to {out}")
 
 
-def build_parser() -> argparse.ArgumentParser:
-    p = argparse.ArgumentParser(
-        prog="jobcli", description="Track job applications from the terminal."
-    )
-    p.add_argument("--version", action="version", version=f"%(prog)s {__version__}")
-    sub = p.add_subparsers(dest="command", required=True)
-
+def _build_init_parser(sub):
     p_init = sub.add_parser("init", help="Initialize the database")
     p_init.set_defaults(func=cmd_init)
 
+
+def _build_summary_parser(sub):
     p_summary = sub.add_parser("summary", help="Show counts for the last N days (default 7)")
     p_summary.add_argument("--days", type=int, default=7)
     p_summary.set_defaults(func=cmd_summary)
 
+
+def _build_add_parser(sub):
     p_add = sub.add_parser("add", help="Add a new application")
     p_add.add_argument("--company", required=True)
     p_add.add_argument("--role", required=True)
@@ -125,6 +159,8 @@ def build_parser() -> argparse.ArgumentParser:
     p_add.add_argument("--notes", default=None)
     p_add.set_defaults(func=cmd_add)
 
+
+def _build_list_parser(sub):
     p_list = sub.add_parser("list", help="List applications")
     p_list.add_argument("--status", default=None)
     p_list.add_argument("--limit", type=int, default=None)
@@ -133,6 +169,8 @@ def build_parser() -> argparse.ArgumentParser:
     )
     p_list.set_defaults(func=cmd_list)
 
+
+def _build_search_parser(sub):
     p_search = sub.add_parser("search", help="Search applications by text")
     p_search.add_argument(
         "--q", required=True, help="Search text (matches company, role, source, notes)"
@@ -140,28 +178,130 @@ def build_parser() -> argparse.ArgumentParser:
     p_search.add_argument("--limit", type=int, default=None)
     p_search.set_defaults(func=cmd_search)
 
+
+def _build_update_parser(sub):
     p_update = sub.add_parser("update", help="Update status/notes for a record")
     p_update.add_argument("--id", type=int, required=True, help="Application ID")
     p_update.add_argument("--status", required=True)
     p_update.add_argument("--notes", default=None)
     p_update.set_defaults(func=cmd_update)
 
+
+def _build_stats_parser(sub):
     p_stats = sub.add_parser("stats", help="Show simple stats")
     p_stats.set_defaults(func=cmd_stats)
 
+
+def _build_export_parser(sub):
     p_export = sub.add_parser("export", help="Export all records to CSV")
     p_export.add_argument("--out", required=True, help="Output CSV path")
     p_export.set_defaults(func=cmd_export)
 
+
+def _build_delete_parser(sub):
     p_delete = sub.add_parser("delete", help="Delete an application by ID")
     p_delete.add_argument("--id", type=int, required=True)
     p_delete.set_defaults(func=cmd_delete)
 
+
+# Subcommand name -> builder, in the order they appear in --help.
+_SUBPARSER_BUILDERS = {
+    "init": _build_init_parser,
+    "summary": _build_summary_parser,
+    "add": _build_add_parser,
+    "list": _build_list_parser,
+    "search": _build_search_parser,
+    "update": _build_update_parser,
+    "stats": _build_stats_parser,
+    "export": _build_export_parser,
+    "delete": _build_delete_parser,
+}
+
+
+def _sniff_subcommand(argv) -> str | None:
+    """Return the subcommand named in argv, or None if there isn't a known one.
+
+    The top-level parser only takes flags, so the first non-flag token is the
+    subcommand. A help flag before it (``jobcli --help add``) asks for the
+    top-level help, which needs every subparser, so that also returns None.
+    """
+    for token in argv:
+        if token in ("-h", "--help"):
+            return None
+        if not token.startswith("-"):
+            return token if token in _SUBPARSER_BUILDERS else None
+    return None
+
+
+def build_parser(only: str | None = None) -> argparse.ArgumentParser:  # noqa: F821
+    """Build the argument parser.
+
+    Args:
+        only: If given, build just this subcommand's parser instead of all of
+            them. Used by main() to skip argparse setup for commands that are
+            not being run.
+    """
+    import argparse
+
+    p = argparse.ArgumentParser(
+        prog="jobcli", description="Track job applications from the terminal."
+    )
+    p.add_argument("-V", "--version", action="version", version=f"%(prog)s {__version__}")
+    sub = p.add_subparsers(dest="command", required=True)
+
+    if only is not None:
+        _SUBPARSER_BUILDERS[only](sub)
+    else:
+        for build in _SUBPARSER_BUILDERS.values():
+            build(sub)
+
     return p
 
 
+# build_parser().format_help() at 80 columns, so bare `jobcli` and
+# `jobcli --help` can print it without importing argparse or building a parser.
+# tests/test_cli.py checks that the two stay in sync.
+#
+# The width is fixed: unlike argparse output (e.g. `jobcli list --help`), this
+# text doesn't rewrap to the terminal or $COLUMNS; it is always the 80-column
+# layout. Wider or narrower terminals get argparse's own layout only for
+# subcommand help.
+_HELP = """\
+usage: jobcli [-h] [-V]
+              {init,summary,add,list,search,update,stats,export,delete} ...
+
+Track job applications from the terminal.
+
+positional arguments:
+  {init,summary,add,list,search,update,stats,export,delete}
+    init                Initialize the database
+    summary             Show counts for the last N days (default 7)
+    add                 Add a new application
+    list                List applications
+    search              Search applications by text
+    update              Update status/notes for a record
+    stats               Show simple stats
+    export              Export all records to CSV
+    delete              Delete an application by ID
+
+options:
+  -h, --help            show this help message and exit
+  -V, --version         show program's version number and exit
+"""
+
+
 def main(argv=None):
-    parser = build_parser()
+    if argv is None:
+        argv = sys.argv[1:]
+    if not argv or argv == ["-h"] or argv == ["--help"]:
+        sys.stdout.write(_HELP)
+        return
+    if argv == ["-V"] or argv == ["--version"]:
+        print(f"jobcli {__version__}")
+        return
+    # Only build the subparser for the command being run; anything without a
+    # known command (e.g. a typo) falls back to the full parser.
+    parser = build_parser(only=_sniff_subcommand(argv))
     args = parser.parse_args(argv)
     args.func(args)
 
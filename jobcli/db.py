@@ -6,9 +6,12 @@ by setting the environment variable JOBCLI_DB_PATH (absolute path).
 
 from __future__ import annotations
 
+import atexit
 import csv
+import functools
 import os
 import sqlite3
+from collections.abc import Iterable
 from dataclasses import dataclass
 from datetime import date, datetime, timedelta
 from pathlib import Path
@@ -18,19 +21,79 @@ DEFAULT_DB_PATH = Path.home() / ".jobcli" / "jobcli.db"
 
 def get_db_path() -> Path:
     """Return DB path, honoring JOBCLI_DB_PATH if set."""
-    return Path(os.getenv("JOBCLI_DB_PATH", str(DEFAULT_DB_PATH)))
+    return _path_from_env(os.getenv("JOBCLI_DB_PATH", str(DEFAULT_DB_PATH)))
+
+
+@functools.lru_cache(maxsize=1)
+def _path_from_env(value: str) -> Path:
+    # Keyed on the raw env value, so changing JOBCLI_DB_PATH (e.g. via
+    # monkeypatch.setenv) simply misses the cache.
+    return Path(value)
+
+
+# Tuned for a single local user: WAL with synchronous=NORMAL makes each commit
+# a single fsync, and reads go through mmap and a larger page cache. Set once
+# per connection, when it's opened.
+_PRAGMAS = """
+    PRAGMA journal_mode = WAL;
+    PRAGMA synchronous = NORMAL;
+    PRAGMA temp_store = MEMORY;
+    PRAGMA mmap_size = 134217728;
+    PRAGMA cache_size = -8192;
+"""
+
+# One connection per process, reopened only if the DB path changes.
+_CONN: sqlite3.Connection | None = None
+_CONN_PATH: Path | None = None
 
 
 def _connect() -> sqlite3.Connection:
-    """Create a SQLite connection and ensure parent directory exists."""
+    """Return the shared SQLite connection, opening it if needed.
+
+    Callers use ``with _connect() as conn:``; the connection's context manager
+    commits or rolls back but does not close, so the connection is reused.
+    """
+    global _CONN, _CONN_PATH
     path = get_db_path()
+    if _CONN is not None and path == _CONN_PATH:
+        return _CONN
+    _reset_connection()
     path.parent.mkdir(parents=True, exist_ok=True)
     conn = sqlite3.connect(path)
     conn.row_factory = sqlite3.Row
+    conn.executescript(_PRAGMAS)
+    _CONN, _CONN_PATH = conn, path
     return conn
 
 
-@dataclass
+def _reset_connection() -> None:
+    """Close the shared connection (if any) so the next call reopens it."""
+    global _CONN, _CONN_PATH
+    if _CONN is not None:
+        _CONN.close()
+    _CONN, _CONN_PATH = None, None
+
+
+atexit.register(_reset_connection)
+
+
+def _today_iso() -> str:
+    """Return today's date as YYYY-MM-DD.
+
+    Call once per batch and reuse the value rather than once per row.
+    """
+    return date.today().isoformat()
+
+
+def _now_iso() -> str:
+    """Return the current local time as an ISO timestamp, to the second.
+
+    Like _today_iso(), hoist this out of loops.
+    """
+    return datetime.now().isoformat(timespec="seconds")
+
+
+@dataclass(slots=True)
 class Application:
     id: int
     company: str
@@ -42,6 +105,21 @@ class Application:
     notes: str | None
 
 
+# Application's fields in declaration order. Queries select these columns
+# explicitly so rows can be unpacked positionally with Application(*row).
+_COLUMNS = [
+    "id",
+    "company",
+    "role",
+    "source",
+    "status",
+    "applied_date",
+    "last_update",
+    "notes",
+]
+_SELECT_COLUMNS = ", ".join(_COLUMNS)
+
+
 def init_db() -> None:
     """Create the database schema if it does not already exist."""
     with _connect() as conn:
@@ -59,6 +137,82 @@ def init_db() -> None:
             )
             """
         )
+        # (status, applied_date) also serves status-only filters and GROUP BY
+        # status via its leading column, so there's no separate status index.
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_status_date ON applications (status, applied_date)"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_applied_date ON applications (applied_date)")
+        _init_fts(conn)
+
+
+# Full-text index over the searchable columns. The trigram tokenizer keeps the
+# substring semantics of the old LIKE '%q%' search, but it can only match
+# queries of at least three characters.
+_FTS_MIN_QUERY_LEN = 3
+
+_FTS_SCHEMA = [
+    """
+    CREATE VIRTUAL TABLE applications_fts USING fts5(
+        company, role, source, notes,
+        content='applications', content_rowid='id', tokenize='trigram'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS applications_fts_ai AFTER INSERT ON applications BEGIN
+        INSERT INTO applications_fts (rowid, company, role, source, notes)
+        VALUES (new.id, new.company, new.role, new.source, new.notes);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS applications_fts_ad AFTER DELETE ON applications BEGIN
+        INSERT INTO applications_fts (applications_fts, rowid, company, role, source, notes)
+        VALUES ('delete', old.id, old.company, old.role, old.source, old.notes);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS applications_fts_au AFTER UPDATE ON applications BEGIN
+        INSERT INTO applications_fts (applications_fts, rowid, company, role, source, notes)
+        VALUES ('delete', old.id, old.company, old.role, old.source, old.notes);
+        INSERT INTO applications_fts (rowid, company, role, source, notes)
+        VALUES (new.id, new.company, new.role, new.source, new.notes);
+    END
+    """,
+]
+
+
+def _init_fts(conn: sqlite3.Connection) -> None:
+    """Create the FTS5 index and its sync triggers, indexing any existing rows.
+
+    Does nothing if this SQLite build lacks FTS5 or the trigram tokenizer;
+    search_applications() then keeps using LIKE.
+    """
+    exists = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'applications_fts'"
+    ).fetchone()
+    if exists:
+        return
+    # sqlite3 runs DDL in autocommit unless a transaction is open, so wrap the
+    # schema explicitly: a failure part-way must not leave the table without
+    # its triggers, since the existence check above would then never retry.
+    conn.execute("BEGIN")
+    try:
+        for stmt in _FTS_SCHEMA:
+            conn.execute(stmt)
+        conn.execute("INSERT INTO applications_fts (applications_fts) VALUES ('rebuild')")
+    except sqlite3.OperationalError:
+        conn.rollback()
+        return
+    conn.commit()
+
+
+_INSERT_SQL = """
+    INSERT INTO applications (
+        company, role, source, status,
+        applied_date, last_update, notes
+    )
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
 
 
 def add_application(
@@ -70,29 +224,65 @@ def add_application(
     notes: str | None = None,
 ) -> int:
     """Insert a new application and return its ID."""
-    applied = applied_date or date.today().isoformat()
-    now = datetime.now().isoformat(timespec="seconds")
+    applied = applied_date or _today_iso()
+    now = _now_iso()
     with _connect() as conn:
         cur = conn.execute(
-            """
-            INSERT INTO applications (
-                company, role, source, status,
-                applied_date, last_update, notes
-            )
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-            """,
+            _INSERT_SQL,
             (company, role, source, status, applied, now, notes),
         )
         return int(cur.lastrowid)
 
 
+def add_applications(records: Iterable[dict]) -> list[int]:
+    """Insert many applications in one transaction and return their IDs.
+
+    Each record takes the same keys as add_application()'s arguments; only
+    "company" and "role" are required.
+    """
+    today = _today_iso()
+    now = _now_iso()
+    rows = [
+        (
+            r["company"],
+            r["role"],
+            r.get("source"),
+            r.get("status", "applied"),
+            r.get("applied_date") or today,
+            now,
+            r.get("notes"),
+        )
+        for r in records
+    ]
+    if not rows:
+        return []
+    with _connect() as conn:
+        conn.executemany(_INSERT_SQL, rows)
+        last = conn.execute("SELECT last_insert_rowid()").fetchone()[0]
+    # The write lock is held for the whole transaction, so the IDs are contiguous.
+    return list(range(last - len(rows) + 1, last + 1))
+
+
 def list_applications(
     status: str | None = None,
     limit: int | None = None,
     since: str | None = None,
 ) -> list[Application]:
     """Fetch applications; optional filters: status, since (YYYY-MM-DD), and limit."""
-    query = "SELECT * FROM applications"
+    return [Application(*r) for r in list_applications_raw(status, limit, since)]
+
+
+def list_applications_raw(
+    status: str | None = None,
+    limit: int | None = None,
+    since: str | None = None,
+) -> list[sqlite3.Row]:
+    """Like list_applications(), but return the rows without building Application objects.
+
+    Columns are in Application field order. Meant for callers that only
+    format the values, such as the CLI table.
+    """
+    query = f"SELECT {_SELECT_COLUMNS} FROM applications"
     clauses: list[str] = []
     params: list[object] = []
 
@@ -106,18 +296,18 @@ def list_applications(
     if clauses:
         query += " WHERE " + " AND ".join(clauses)
 
-    query += " ORDER BY id DESC"
-    if limit:
-        query += f" LIMIT {int(limit)}"
+    # Always bind LIMIT (-1 means none) so the SQL text depends only on which
+    # filters are set, letting sqlite3's statement cache reuse the plan.
+    query += " ORDER BY id DESC LIMIT ?"
+    params.append(int(limit) if limit else -1)
 
     with _connect() as conn:
-        rows = conn.execute(query, params).fetchall()
-    return [Application(**dict(r)) for r in rows]
+        return conn.execute(query, params).fetchall()
 
 
 def update_application(app_id: int, status: str, notes: str | None = None) -> bool:
     """Update status (and notes if provided). Returns True if a row was updated."""
-    now = datetime.now().isoformat(timespec="seconds")
+    now = _now_iso()
     with _connect() as conn:
         if notes is None:
             cur = conn.execute(
@@ -138,13 +328,31 @@ def update_status(app_id: int, status: str, notes: str | None = None) -> bool:
 
 
 def get_stats() -> dict:
-    """Return total and counts by status."""
+    """Return total, counts by status, and how many were applied in the last 7 days."""
+    since_date = (date.today() - timedelta(days=7)).isoformat()
+    # One pass over the (status, applied_date) index; totals are rolled up here.
     with _connect() as conn:
-        total = conn.execute("SELECT COUNT(*) FROM applications").fetchone()[0]
-        by_status_rows = conn.execute(
-            "SELECT status, COUNT(*) as c FROM applications GROUP BY status"
+        rows = conn.execute(
+            """
+            SELECT status,
+                   COUNT(*) AS c,
+                   SUM(CASE WHEN applied_date >= ? THEN 1 ELSE 0 END) AS recent
+            FROM applications
+            GROUP BY status
+            """,
+            (since_date,),
         ).fetchall()
-    return {"total": total, "by_status": {r["status"]: r["c"] for r in by_status_rows}}
+    # Unpack rows positionally rather than via sqlite3.Row's name lookup.
+    by_status = {}
+    recent_total = 0
+    for status, c, recent in rows:
+        by_status[status] = c
+        recent_total += recent
+    return {
+        "total": sum(by_status.values()),
+        "applied_last_7_days": recent_total,
+        "by_status": by_status,
+    }
 
 
 def stats() -> dict:
@@ -155,43 +363,59 @@ def stats() -> dict:
 def export_csv(out_path: str | Path) -> int:
     """Export all records to CSV. Returns the number of rows written."""
     out = Path(out_path)
+    sql = f"SELECT {_SELECT_COLUMNS} FROM applications ORDER BY id"
+    n = 0
     with _connect() as conn, out.open("w", newline="", encoding="utf-8") as f:
         writer = csv.writer(f)
-        writer.writerow(
-            ["id", "company", "role", "source", "status", "applied_date", "last_update", "notes"]
-        )
-        rows = conn.execute("SELECT * FROM applications ORDER BY id").fetchall()
-        for r in rows:
-            writer.writerow(
-                [
-                    r["id"],
-                    r["company"],
-                    r["role"],
-                    r["source"],
-                    r["status"],
-                    r["applied_date"],
-                    r["last_update"],
-                    r["notes"],
-                ]
-            )
-    return len(rows)
+        writer.writerow(_COLUMNS)
+        # Stream from the cursor rather than fetchall() so memory stays flat.
+        for row in conn.execute(sql):
+            writer.writerow(row)
+            n += 1
+    return n
 
 
 def search_applications(query: str, limit: int | None = None) -> list[Application]:
     """Return rows where query matches company, role, source, or notes."""
+    return [Application(*r) for r in search_applications_raw(query, limit)]
+
+
+def search_applications_raw(query: str, limit: int | None = None) -> list[sqlite3.Row]:
+    """Like search_applications(), but return the rows without building Application objects.
+
+    Columns are in Application field order.
+    """
+    if len(query) >= _FTS_MIN_QUERY_LEN:
+        # Quote the query as a single FTS phrase so user text is never parsed
+        # as FTS syntax.
+        phrase = '"' + query.replace('"', '""') + '"'
+        sql = f"""
+            SELECT {_SELECT_COLUMNS} FROM applications
+            WHERE id IN (
+                SELECT rowid FROM applications_fts WHERE applications_fts MATCH ?
+            )
+            ORDER BY id DESC
+            LIMIT ?
+        """
+        try:
+            with _connect() as conn:
+                return conn.execute(sql, (phrase, limit or -1)).fetchall()
+        except sqlite3.OperationalError:
+            # No FTS index (DB predates it or SQLite lacks FTS5); fall back to LIKE.
+            pass
+
     like = f"%{query}%"
-    sql = """
-        SELECT * FROM applications
+    sql = f"""
+        SELECT {_SELECT_COLUMNS} FROM applications
         WHERE company LIKE ?
            OR role LIKE ?
            OR IFNULL(source, '') LIKE ?
            OR IFNULL(notes, '') LIKE ?
         ORDER BY id DESC
+        LIMIT ?
     """
     with _connect() as conn:
-        rows = conn.execute(sql, (like, like, like, like)).fetchall()
-    apps = [Application(**dict(r)) for r in rows]
-    return apps[:limit] if limit else apps
+        return conn.execute(sql, (like, like, like, like, limit or -1)).fetchall()
 
 
 def delete_application(app_id: int) -> bool:
@@ -213,5 +437,5 @@ def summary_last_n_days(days: int = 7) -> dict:
             (since_date,),
         ).fetchall()
 
-    by_status = {r["status"]: r["c"] for r in by_status_rows}
+    by_status = {status: c for status, c in by_status_rows}
     return {"since": since_date, "days": days, "total": total, "by_status": by_status}
@@ -0,0 +1,30 @@
+import pytest
+
+import jobcli.cli as cli
+from jobcli import __version__
+
+
+def test_static_help_matches_parser(monkeypatch):
+    monkeypatch.setenv("COLUMNS", "80")
+    assert cli._HELP == cli.build_parser().format_help()
+
+
+@pytest.mark.parametrize("argv", [[], ["-h"], ["--help"]])
+def test_help_short_circuit(argv, capsys):
+    cli.main(argv)
+    assert capsys.readouterr().out == cli._HELP
+
+
+@pytest.mark.parametrize("argv", [["-V"], ["--version"]])
+def test_version_short_circuit(argv, capsys):
+    cli.main(argv)
+    assert capsys.readouterr().out == f"jobcli {__version__}\n"
+
+
+def test_sniff_subcommand():
+    assert cli._sniff_subcommand(["list", "--limit", "3"]) == "list"
+    assert cli._sniff_subcommand(["--help", "add"]) is None
+    assert cli._sniff_subcommand(["-h", "list"]) is None
+    assert cli._sniff_subcommand(["list", "--help"]) == "list"
+    assert cli._sniff_subcommand(["bogus"]) is None
+    assert cli._sniff_subcommand(["--version"]) is None
@@ -24,6 +24,7 @@ def test_happy_flow(tmp_path, monkeypatch):
     s = db.stats()
     assert s["total"] == 1
     assert s["by_status"]["interview"] == 1
+    assert s["applied_last_7_days"] == 1
 
     out_csv = tmp_path / "out.csv"
     n = db.export_csv(out_csv)
@@ -85,3 +86,129 @@ def test_summary_last_7(tmp_path, monkeypatch):
     assert s["total"] == 2
     assert s["by_status"]["applied"] == 1
     assert s["by_status"]["interview"] == 1
+
+
+def test_connection_reused_per_path(tmp_path, monkeypatch):
+    monkeypatch.setenv("JOBCLI_DB_PATH", str(tmp_path / "a.db"))
+    conn = db._connect()
+    assert db._connect() is conn
+
+    # Pointing JOBCLI_DB_PATH elsewhere opens a fresh connection.
+    monkeypatch.setenv("JOBCLI_DB_PATH", str(tmp_path / "b.db"))
+    db.init_db()
+    assert db._connect() is not conn
+    assert db.list_applications() == []
+
+    db._reset_connection()
+    assert db._CONN is None
+
+
+def test_search(tmp_path, monkeypatch):
+    monkeypatch.setenv("JOBCLI_DB_PATH", str(tmp_path / "test.db"))
+
+    db.init_db()
+    acme = db.add_application(company="Acme", role="Data Analyst", source="LinkedIn")
+    db.add_application(company="Globex", role="Engineer", notes="referral from Acme")
+    db.add_application(company="Initech", role="Analyst")
+
+    # Substring, case-insensitive, across company/role/source/notes.
+    assert [r.company for r in db.search_applications("acme")] == ["Globex", "Acme"]
+    assert [r.company for r in db.search_applications("nalys")] == ["Initech", "Acme"]
+    assert [r.company for r in db.search_applications("linked")] == ["Acme"]
+    assert len(db.search_applications("Analyst", limit=1)) == 1
+    # Short queries are below the trigram minimum and go through LIKE.
+    assert {r.company for r in db.search_applications("Ac")} == {"Acme", "Globex"}
+    assert len(db.search_applications("Ac", limit=1)) == 1
+
+    # The index follows updates and deletes.
+    db.update_status(acme, "interview", notes="onsite")
+    assert [r.company for r in db.search_applications("onsite")] == ["Acme"]
+    db.delete_application(acme)
+    assert db.search_applications("onsite") == []
+
+
+def test_add_applications_bulk(tmp_path, monkeypatch):
+    monkeypatch.setenv("JOBCLI_DB_PATH", str(tmp_path / "test.db"))
+
+    db.init_db()
+    first = db.add_application(company="Existing", role="Analyst")
+    ids = db.add_applications(
+        [
+            {"company": "Acme", "role": "Analyst"},
+            {"company": "Globex", "role": "Engineer", "status": "interview", "notes": "onsite"},
+            {"company": "Initech", "role": "Analyst", "applied_date": "2025-01-01"},
+        ]
+    )
+    assert ids == [first + 1, first + 2, first + 3]
+
+    rows = {r.id: r for r in db.list_applications()}
+    assert rows[ids[0]].status == "applied"
+    assert rows[ids[0]].applied_date == date.today().isoformat()
+    assert rows[ids[1]].notes == "onsite"
+    assert rows[ids[2]].applied_date == "2025-01-01"
+
+    assert db.add_applications([]) == []
+
+
+def test_list_limit(tmp_path, monkeypatch):
+    monkeypatch.setenv("JOBCLI_DB_PATH", str(tmp_path / "test.db"))
+
+    db.init_db()
+    db.add_applications([{"company": f"Co{i}", "role": "Analyst"} for i in range(5)])
+
+    assert [r.company for r in db.list_applications(limit=2)] == ["Co4", "Co3"]
+    assert len(db.list_applications(limit=None)) == 5
+    assert len(db.list_applications(status="applied", limit=3)) == 3
+
+
+def test_stats_counts(tmp_path, monkeypatch):
+    monkeypatch.setenv("JOBCLI_DB_PATH", str(tmp_path / "test.db"))
+
+    db.init_db()
+    older = (date.today() - timedelta(days=30)).isoformat()
+    assert db.stats() == {"total": 0, "applied_last_7_days": 0, "by_status": {}}
+
+    db.add_application(company="OldCo", role="Analyst", applied_date=older)
+    db.add_application(company="NewCo", role="Analyst", status="interview")
+    s = db.stats()
+    assert s["total"] == 2
+    assert s["applied_last_7_days"] == 1
+    assert s["by_status"] == {"applied": 1, "interview": 1}
+
+
+def test_db_path_follows_env(tmp_path, monkeypatch):
+    monkeypatch.setenv("JOBCLI_DB_PATH", str(tmp_path / "a.db"))
+    assert db.get_db_path() is db.get_db_path()
+    assert db.get_db_path() == tmp_path / "a.db"
+
+    monkeypatch.setenv("JOBCLI_DB_PATH", str(tmp_path / "b.db"))
+    assert db.get_db_path() == tmp_path / "b.db"
+
+    monkeypatch.delenv("JOBCLI_DB_PATH")
+    assert db.get_db_path() == db.DEFAULT_DB_PATH
+
+
+def test_fts_setup_is_all_or_nothing(tmp_path, monkeypatch):
+    monkeypatch.setenv("JOBCLI_DB_PATH", str(tmp_path / "test.db"))
+
+    # Make the last trigger fail after the table and earlier triggers succeed.
+    monkeypatch.setattr(db, "_FTS_SCHEMA", [*db._FTS_SCHEMA[:-1], "CREATE TRIGGER broken"])
+    db.init_db()
+    conn = db._connect()
+    leftovers = conn.execute(
+        "SELECT name FROM sqlite_master WHERE name LIKE 'applications_fts%'"
+    ).fetchall()
+    assert leftovers == []
+    db.add_application(company="Acme", role="Analyst")
+    assert [r.company for r in db.search_applications("acme")] == ["Acme"]
+
+    # A later init_db() with the real schema builds the complete index.
+    monkeypatch.undo()
+    monkeypatch.setenv("JOBCLI_DB_PATH", str(tmp_path / "test.db"))
+    db.init_db()
+    triggers = conn.execute(
+        "SELECT COUNT(*) FROM sqlite_master WHERE type = 'trigger' AND name LIKE 'applications_fts%'"
+    ).fetchone()[0]
+    assert triggers == 3
+    db.update_status(1, "interview", notes="onsite")
+    assert [r.company for r in db.search_applications("onsite")] == ["Acme"]